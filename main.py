@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import shutil
+import tomllib
 from pathlib import Path
 
-import tomlkit
-
 from src.build import BUILD_DIR
 from src.build import PkgConfig
 from src.build import generate_main_index
@@ -15,8 +15,8 @@ CONFIG_FILEPATH = Path("index.toml")
 
 
 if __name__ == "__main__":
-    with CONFIG_FILEPATH.open(mode="r", encoding="utf-8") as f:
-        config = tomlkit.parse(f.read())
+    with CONFIG_FILEPATH.open(mode="rb") as f:
+        config = tomllib.load(f)
 
     packages: dict[str, PkgConfig] = {}
 
@@ -41,7 +41,14 @@ if __name__ == "__main__":
 
     BUILD_DIR.mkdir(exist_ok=True, parents=True)
 
-    for package in sorted(packages.values(), key=lambda x: x.name):
-        generate_project_index(package)
+    # Each package is network-bound (index page + variant JSONs), so fan the
+    # work out over threads - the GIL is released during socket reads.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        list(
+            executor.map(
+                generate_project_index,
+                sorted(packages.values(), key=lambda x: x.name),
+            )
+        )
 
     generate_main_index(packages=list(packages.keys()))
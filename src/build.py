@@ -1,23 +1,33 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import datetime
+import functools
+import gzip
 import hashlib
-import json
 import logging
+import os
 import re
 from dataclasses import dataclass
+from operator import attrgetter
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
+from typing import NamedTuple
 from urllib.parse import urljoin
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 import jinja2
 import jsonschema
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from lxml import etree
 from packaging.version import Version
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.schemas.v0_0_2 import WheelVariantJSON_V0_0_2
 from src.schemas.v0_0_3 import WheelVariantJSON_V0_0_3
@@ -29,25 +39,57 @@ BUILD_DATE = datetime.datetime.now(tz=ZoneInfo("America/New_York")).strftime(
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session: keep-alive + connection pooling means one TCP/TLS
+# handshake per host instead of one per request. Responses are cached on disk
+# (outside BUILD_DIR, which gets wiped every run) and revalidated with
+# conditional GETs, so unchanged index pages and immutable schema documents
+# cost a 304 instead of a full body download.
+_SESSION = requests_cache.CachedSession(
+    cache_name=".http_cache",
+    backend="sqlite",
+    expire_after=3600,
+    cache_control=True,
+)
+_SESSION.headers.update(
+    {"User-Agent": "variants-index/1.0", "Accept-Encoding": "gzip, deflate"}
+)
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+    ),
+)
+_SESSION.mount("https://", _HTTP_ADAPTER)
+_SESSION.mount("http://", _HTTP_ADAPTER)
+
+# Build the Jinja environment once at import: template compilation is paid a
+# single time per process, and the on-disk bytecode cache (outside BUILD_DIR,
+# which gets wiped every run) skips it entirely on warm starts.
+_JINJA_CACHE_DIR = Path(".jinja_cache")
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(str(_JINJA_CACHE_DIR)),
+)
+# Shared by every page; bound once as a global instead of per render call.
+_JINJA_ENV.globals["build_date"] = BUILD_DATE
+_MAIN_TEMPLATE = _JINJA_ENV.get_template("main_page.j2")
+_PROJECT_TEMPLATE = _JINJA_ENV.get_template("project_page.j2")
+
 VARIANT_JSON_FILE_REGEX = re.compile(r"\S*-(.*)-variants\.json")
+# <name>-<ver>[-<build>]-<pyver>-<abi>-<plat>[-<variant_label>].whl
+# Greedy dash-excluding groups (used with fullmatch) keep backtracking to a
+# minimum compared to the previous lazy VERBOSE pattern.
 VARIANT_WHL_FILE_REGEX = re.compile(
-    r"(?P<base_wheel_name>                "  # <base_wheel_name> group (without variant)
-    r"  (?P<namever>                      "  # "namever" group contains <name>-<ver>
-    r"    (?P<name>[^\s-]+?)              "  # <name>
-    r"    - (?P<ver>[^\s-]*?)             "  # "-" <ver>
-    r"  )                                 "  # close "namever" group
-    r"  (?: - (?P<build>\d[^-]*?) )?      "  # optional "-" <build>
-    r"  - (?P<pyver>[^\s-]+?)             "  # "-" <pyver> tag
-    r"  - (?P<abi>[^\s-]+?)               "  # "-" <abi> tag
-    r"  - (?P<plat>[^\s-]+?)              "  # "-" <plat> tag
-    r")                                   "  # end of <base_wheel_name> group
-    r"(?: - (?P<variant_label>            "  # optional <variant_label>
-    r"     [0-9a-z._]{1,16}              "
-    r"    )                               "
-    r")?                                  "
-    r"\.whl                               "  # ".whl" suffix
-    r"                                    ",
-    re.VERBOSE,
+    r"(?P<name>[^\s-]+)-(?P<ver>[^\s-]+)"
+    r"(?:-(?P<build>\d[^-]*))?"
+    r"-(?P<pyver>[^\s-]+)-(?P<abi>[^\s-]+)-(?P<plat>[^\s-]+?)"
+    r"(?:-(?P<variant_label>[0-9a-z._]{1,16}))?"
+    r"\.whl"
 )
 
 
@@ -55,13 +97,74 @@ class VariantVersionNotSupportedError(Exception):
     """Raised when a variant version is not supported."""
 
 
-def sha256sum(path: Path, chunk_size: int = 8192) -> str:
+class WheelNameParts(NamedTuple):
+    name: str
+    ver: str
+    build: str | None
+    pyver: str
+    abi: str
+    plat: str
+    variant_label: str | None
+
+
+_VARIANT_LABEL_REGEX = re.compile(r"[0-9a-z._]{1,16}\Z")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_whl(filename: str) -> WheelNameParts:
+    """Parse a wheel filename, caching the result per unique filename.
+
+    Wheel filenames follow the strict `name-ver[-build]-pyver-abi-plat
+    [-variant_label].whl` grammar, so a `str.split` fast path resolves the
+    regular shapes without any regex state machine; anything irregular falls
+    back to the full regex.
+    """
+    if filename.endswith(".whl"):
+        parts = filename[: -len(".whl")].split("-")
+        if all(parts) and not any(map(str.isspace, filename)):
+            match len(parts):
+                case 5:
+                    name, ver, pyver, abi, plat = parts
+                    return WheelNameParts(name, ver, None, pyver, abi, plat, None)
+                case 6 if parts[2][:1].isdigit():
+                    # A build tag must start with a digit; like the regex,
+                    # prefer this reading over a variant label.
+                    return WheelNameParts(
+                        parts[0], parts[1], parts[2], *parts[3:], None
+                    )
+                case 6 if _VARIANT_LABEL_REGEX.match(parts[5]):
+                    name, ver, pyver, abi, plat, label = parts
+                    return WheelNameParts(name, ver, None, pyver, abi, plat, label)
+                case 7 if parts[2][:1].isdigit() and _VARIANT_LABEL_REGEX.match(
+                    parts[6]
+                ):
+                    return WheelNameParts(*parts)
+                case _:
+                    pass
+
+    match = VARIANT_WHL_FILE_REGEX.fullmatch(filename)
+    if match is None:
+        raise ValueError(f"Impossible to match the regex with `{filename}`")
+    return WheelNameParts(
+        *match.group("name", "ver", "build", "pyver", "abi", "plat", "variant_label")
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_json(name: str) -> re.Match[str]:
+    """Match a variants JSON filename, caching the result per unique filename."""
+    match = VARIANT_JSON_FILE_REGEX.match(name)
+    if match is None:
+        raise ValueError(f"Impossible to match the regex with `{name}`")
+    return match
+
+
+def sha256sum(path: Path) -> str:
     """Compute the SHA-256 checksum of a file."""
-    h = hashlib.sha256()
+    # `hashlib.file_digest` runs the whole read/update loop in C and releases
+    # the GIL while OpenSSL hashes.
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 @dataclass(frozen=True)
@@ -70,130 +173,135 @@ class PkgConfig:
     registry: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Artifact:
     name: str
     link: str
     checksum: str
 
-    def re_match(self, regex: re.Pattern[str]) -> re.Match[str]:
-        match = regex.match(self.name)
-        if match is None:
-            raise ValueError(f"Impossible to match the regex with `{self.name}`")
 
-        return match
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VariantJson(Artifact):
     @property
     def version(self) -> str:
-        return self.re_match(VARIANT_JSON_FILE_REGEX).group(1)
-
-    @classmethod
-    def from_file(cls, fp: Path) -> VariantJson:
-        return VariantJson(name=fp.name, link=fp.name, checksum=sha256sum(fp))
+        return _match_json(self.name).group(1)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VariantWheel(Artifact):
     vprops: list[str] | None = None
 
     @property
     def version(self) -> str:
-        return self.re_match(VARIANT_WHL_FILE_REGEX).group("ver")
+        return _parse_whl(self.name).ver
 
     @property
-    def variant_alias(self) -> str:
-        return self.re_match(VARIANT_WHL_FILE_REGEX).group("variant_label")
+    def variant_alias(self) -> str | None:
+        return _parse_whl(self.name).variant_label
 
 
+@functools.lru_cache(maxsize=256)
 def safe_urljoin(base: str, path: str) -> str:
     if not base.endswith("/"):
         base += "/"
     return urljoin(base, path)
 
 
-def generate_main_index(packages: list[str]) -> None:
-    # Load template
-    current_dir = Path(__file__).parent
-    jinja_env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(current_dir / "templates"),
-        autoescape=True,
+def write_index_html(directory: Path, output: str) -> None:
+    """Write an index.html and a precompressed .gz copy next to it.
+
+    Compressing once at build time lets the CDN serve the ~5-10x smaller
+    gzip body without paying for per-request compression. `mtime=0` keeps
+    the .gz bytes reproducible across runs.
+    """
+    encoded = output.encode("utf-8")
+    (directory / "index.html").write_bytes(encoded)
+    (directory / "index.html.gz").write_bytes(
+        gzip.compress(encoded, compresslevel=9, mtime=0)
     )
-    template = jinja_env.get_template("main_page.j2")
 
-    filtered_packages = [pkg for pkg in packages if (BUILD_DIR / pkg).is_dir()]
+
+def generate_main_index(packages: list[str]) -> None:
+    # One scandir pass over BUILD_DIR instead of one stat() per package.
+    existing_dirs = {entry.name for entry in os.scandir(BUILD_DIR) if entry.is_dir()}
+    filtered_packages = [pkg for pkg in packages if pkg in existing_dirs]
 
     # Render template
-    output = template.render(
-        directories=sorted(filtered_packages),
-        build_date=BUILD_DATE,
-    )
+    output = _MAIN_TEMPLATE.render(directories=sorted(filtered_packages))
 
-    with (BUILD_DIR / "index.html").open(mode="w") as f:
-        f.write(output)
+    write_index_html(BUILD_DIR, output)
 
 
 def fetch_links(url: str) -> list[VariantWheel | VariantJson]:
-    # Fetch the content of the URL
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()  # Ensure we notice bad responses
+    # Fetch the content of the URL, streaming the body straight into lxml so
+    # the full HTML is never materialized as an intermediate Python str.
+    with _SESSION.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()  # Ensure we notice bad responses
+
+        response.raw.decode_content = True  # transparently un-gzip while reading
+        # HTMLParser instances are not thread-safe, so build one per call - it
+        # is cheap next to the network round trip.
+        tree = etree.parse(
+            response.raw,
+            etree.HTMLParser(encoding=response.encoding, collect_ids=False),
+        )
 
-    # Parse the HTML content
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Normalize the base once instead of re-checking the trailing slash for
+    # every anchor on the page.
+    base_url = url if url.endswith("/") else url + "/"
 
-    # Find all <a> tags with href attribute ending with .json or .whl
+    # Walk all <a> tags with an href ending with .json or .whl; iterating the
+    # lxml tree directly avoids any per-node Python traversal overhead.
     artifacts: list[VariantWheel | VariantJson] = []
-    for a_tag in soup.find_all("a", href=True):
-        href: str = a_tag["href"]  # pyright: ignore[reportUnknownVariableType, reportAssignmentType, reportArgumentType, reportIndexIssue]
+    for a_tag in tree.iter("a"):
+        href: str | None = a_tag.get("href")
+        if href is None:
+            continue
 
-        if (link := href.split("#", maxsplit=1)[0]).endswith((".json", ".whl")):  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType, reportAttributeAccessIssue]
-            checksum = ""
+        # `str.partition` is considerably cheaper than `urlparse` for
+        # splitting off the checksum fragment.
+        link, _, fragment = href.partition("#")
 
-            # Case 1: checksum inside the href fragment
-            parsed = urlparse(href)  # pyright: ignore[reportArgumentType, reportCallIssue]
-            if parsed.fragment.startswith("sha256="):
-                checksum: str = parsed.fragment.split("=", 1)[1]
+        if not (is_json := link.endswith(".json")) and not link.endswith(".whl"):
+            continue
 
-            # Case 2: checksum inside integrity attribute
-            elif integrity := a_tag.get("integrity"):  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
-                if integrity.startswith("sha256-"):  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
-                    checksum: str = integrity.split("sha256-", 1)[1]  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType, reportAttributeAccessIssue]
+        checksum = ""
 
-            absolute_link = safe_urljoin(url, link)
-            filename: str = a_tag.text.strip()
+        # Case 1: checksum inside the href fragment
+        if fragment.startswith("sha256="):
+            checksum: str = fragment[len("sha256=") :]
 
-            if filename.endswith(".json"):
-                artifacts.append(
-                    VariantJson(name=filename, link=absolute_link, checksum=checksum)  # pyright: ignore[reportUnknownArgumentType]
-                )
+        # Case 2: checksum inside integrity attribute
+        elif integrity := a_tag.get("integrity"):
+            if integrity.startswith("sha256-"):
+                checksum: str = integrity[len("sha256-") :]
 
-            elif filename.endswith(".whl"):
-                artifacts.append(
-                    VariantWheel(name=filename, link=absolute_link, checksum=checksum)  # pyright: ignore[reportUnknownArgumentType]
-                )
+        absolute_link = urljoin(base_url, link)
+        filename: str = "".join(a_tag.itertext()).strip()
 
-            else:
-                raise ValueError(f"Unknown file extension: `{filename}` ...")
+        if is_json:
+            artifacts.append(
+                VariantJson(name=filename, link=absolute_link, checksum=checksum)  # pyright: ignore[reportUnknownArgumentType]
+            )
+        else:
+            artifacts.append(
+                VariantWheel(name=filename, link=absolute_link, checksum=checksum)  # pyright: ignore[reportUnknownArgumentType]
+            )
 
     return artifacts
 
 
-def pkg_name_to_version(pkg_name: str) -> Version:
-    return Version(pkg_name.split("-", maxsplit=2)[1])
-
-
-def collect_all_links(pkgconfig: PkgConfig) -> list[VariantWheel | VariantJson]:
-    artifacts = fetch_links(safe_urljoin(pkgconfig.registry, pkgconfig.name + "/"))
-
-    variant_versions: set[Version] = {
-        pkg_name_to_version(artifact.name)
-        for artifact in artifacts
-        if isinstance(artifact, VariantWheel)
+def merge_pypi_links(
+    artifacts: list[VariantWheel | VariantJson], pkgconfig: PkgConfig
+) -> None:
+    """Append the wheels published on PyPI for versions without variants."""
+    # Wheel filenames carry normalized versions, so plain strings from the
+    # cached filename match dedup just as well as Version objects - without
+    # running Version's verbose regex per file.
+    variant_versions: set[str] = {
+        artifact.version for artifact in artifacts if isinstance(artifact, VariantWheel)
     }
 
-    # Also add the packages published on PyPI
     with contextlib.suppress(requests.exceptions.HTTPError):
         for artifact in fetch_links(
             safe_urljoin("https://pypi.org/simple", pkgconfig.name + "/")
@@ -203,20 +311,27 @@ def collect_all_links(pkgconfig: PkgConfig) -> list[VariantWheel | VariantJson]:
                     f"Unexpected Object found on pypi.org `{artifact.name}`"
                 )
 
-            if pkg_name_to_version(artifact.name) in variant_versions:
+            if artifact.version in variant_versions:
                 continue
 
             artifacts.append(artifact)
 
-    return artifacts
+
+@functools.lru_cache(maxsize=8)
+def _fetch_schema(url: str) -> dict[str, Any]:
+    """Fetch a JSON schema document, once per process."""
+    response = _SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
 def download_json(url: str) -> dict[str, Any]:
     # Fetch the JSON content from the URL
-    response = requests.get(url, timeout=10)
+    response = _SESSION.get(url, timeout=10)
     response.raise_for_status()  # Ensure we notice bad responses
 
-    data = response.json()
+    # orjson parses the raw bytes directly - no intermediate str decode.
+    data = orjson.loads(response.content)
 
     if "variants-schema.wheelnext.dev" in data["$schema"]:
         # This schema has been renamed
@@ -242,47 +357,63 @@ def download_json(url: str) -> dict[str, Any]:
             print(f"Validation failed for: {url}")  # noqa: T201
             raise
 
-        schema = download_json(url=data["$schema"])
+        schema = _fetch_schema(data["$schema"])
         jsonschema.validate(instance=data, schema=schema)
 
     return data
 
 
-def load_variant_json(url: str, pkg_cfg: PkgConfig) -> dict[str, Any]:
+def load_variant_json(url: str, pkg_cfg: PkgConfig) -> tuple[dict[str, Any], str]:
+    """Load a variant JSON file and the SHA-256 checksum of its on-disk copy."""
     parsed_url = urlparse(url)
 
     if not (
         variant_f := BUILD_DIR / pkg_cfg.name / Path(parsed_url.path).name
     ).exists():
         data = download_json(url)
+        # The files stay human-readable (sorted keys, indented) - orjson just
+        # serializes them an order of magnitude faster than stdlib json.
+        serialized = orjson.dumps(
+            data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+        )
         variant_f.parent.mkdir(exist_ok=True, parents=True)
-        with variant_f.open(mode="w") as f:
-            json.dump(data, f, sort_keys=True, indent=4)
-        return data
+        variant_f.write_bytes(serialized)
+        # Hash the bytes just serialized instead of re-reading the file later.
+        return data, hashlib.sha256(serialized).hexdigest()
 
-    with variant_f.open(mode="r") as f:
-        return json.load(f)
+    return orjson.loads(variant_f.read_bytes()), sha256sum(variant_f)
 
 
 def generate_project_index(pkg_config: PkgConfig) -> None:
     print()  # noqa: T201
     logger.info("Processing `%s` ...", pkg_config.name)
-    # Load template
-    current_dir = Path(__file__).parent
-    jinja_env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(current_dir / "templates"),
-        autoescape=True,
-    )
-    template = jinja_env.get_template("project_page.j2")
 
-    artifacts = collect_all_links(pkg_config)
+    artifacts = fetch_links(safe_urljoin(pkg_config.registry, pkg_config.name + "/"))
 
     variants_json_files = sorted(
         [artifact for artifact in artifacts if isinstance(artifact, VariantJson)],
-        key=lambda x: x.name,
+        key=attrgetter("name"),
     )
 
     variant_configs: dict[str, dict[str, list[str]]] = {}
+    written_vjson_files: list[VariantJson] = []
+
+    # Bound method hoisted to a local: `" :: ".join(tuple)` is cheaper than an
+    # f-string in the triple-nested comprehension below.
+    join_vprop = " :: ".join
+
+    # Fan out the JSON downloads as soon as the registry links are known - each
+    # one is an independent HTTP round trip, and the PyPI fallback fetch runs
+    # while they are in flight. The dict-building below stays serial (and
+    # fast) to keep the duplicate-version error deterministic.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {
+            vjson_f: executor.submit(load_variant_json, vjson_f.link, pkg_config)
+            for vjson_f in variants_json_files
+        }
+
+        # Also add the packages published on PyPI
+        merge_pypi_links(artifacts, pkg_config)
 
     for vjson_f in variants_json_files:
         if vjson_f.version in variant_configs:
@@ -292,7 +423,7 @@ def generate_project_index(pkg_config: PkgConfig) -> None:
             )
 
         try:
-            data = load_variant_json(vjson_f.link, pkg_cfg=pkg_config)
+            data, checksum = futures[vjson_f].result()
         except VariantVersionNotSupportedError:
             logger.warning("Skipping `%s` ... Not compatible.", vjson_f.name)
             continue
@@ -300,9 +431,13 @@ def generate_project_index(pkg_config: PkgConfig) -> None:
         if (variant_info := data.get("variants", None)) is None:
             raise ValueError("Invalid Variant JSON file format ...")
 
+        written_vjson_files.append(
+            VariantJson(name=vjson_f.name, link=vjson_f.name, checksum=checksum)
+        )
+
         variant_configs[vjson_f.version] = {
             variant_alias: [
-                f"{ns} :: {vfeat_name} :: {vfeat_val}"
+                join_vprop((ns, vfeat_name, vfeat_val))
                 for ns, vfeat_data in variant_data.items()
                 for vfeat_name, vfeat_values in vfeat_data.items()
                 for vfeat_val in vfeat_values
@@ -310,52 +445,70 @@ def generate_project_index(pkg_config: PkgConfig) -> None:
             for variant_alias, variant_data in variant_info.items()
         }
 
+    # Flatten the nested mapping into a single (version, label) -> vprops dict
+    # so augmenting a wheel costs one cached parse and one dict hit.
+    vprops_index: dict[tuple[str, str], list[str]] = {
+        (version, variant_alias): vprops
+        for version, aliases in variant_configs.items()
+        for variant_alias, vprops in aliases.items()
+    }
+
     def augment_wheel_variant(artifact: VariantWheel) -> VariantWheel:
+        parts = _parse_whl(artifact.name)
         return VariantWheel(
             name=artifact.name,
             link=artifact.link,
             checksum=artifact.checksum,
             vprops=(
-                variant_configs[artifact.version][artifact.variant_alias]
-                if artifact.variant_alias
+                vprops_index[(parts.ver, parts.variant_label)]
+                if parts.variant_label
                 else []
             ),
         )
 
-    wheel_files = sorted(
-        [
-            augment_wheel_variant(artifact)
-            for artifact in artifacts
-            if (
-                isinstance(artifact, VariantWheel)
-                and (not artifact.variant_alias or artifact.version in variant_configs)
-            )
-        ],
-        key=lambda x: (Version(x.name.split("-", maxsplit=2)[1]), x.name),
-        reverse=True,
-    )
+    augmented_wheels = [
+        augment_wheel_variant(artifact)
+        for artifact in artifacts
+        if (
+            isinstance(artifact, VariantWheel)
+            and (not artifact.variant_alias or artifact.version in variant_configs)
+        )
+    ]
+
+    # Decorate-sort-undecorate: build each (Version, name) key eagerly from
+    # the cached filename match rather than inside the sort.
+    keyed_wheels = [((Version(whl.version), whl.name), whl) for whl in augmented_wheels]
+    keyed_wheels.sort(key=itemgetter(0), reverse=True)
+    wheel_files = [whl for _, whl in keyed_wheels]
 
     if not wheel_files:
         logger.warning("No wheel files found for `%s`. Skipping...", pkg_config.name)
         return
 
-    # Render template
-    output = template.render(
+    keyed_vjsons = [((Version(vf.version), vf.name), vf) for vf in written_vjson_files]
+    keyed_vjsons.sort(key=itemgetter(0), reverse=True)
+
+    # Hand the template plain dicts: Jinja resolves them through a single
+    # getitem lookup instead of the dataclass descriptor protocol, which is
+    # noticeably faster across thousands of rows.
+    output = _PROJECT_TEMPLATE.render(
         project_name=pkg_config.name,
-        variants_json_files=sorted(
-            [
-                VariantJson.from_file(fp)
-                for fp in (BUILD_DIR / pkg_config.name).glob("*.json")
-            ],
-            key=lambda vf: (Version(vf.name.split("-", maxsplit=2)[1]), vf.name),
-            reverse=True,
-        ),
-        wheel_variant_files=wheel_files,
-        build_date=BUILD_DATE,
+        variants_json_files=[
+            {"name": vf.name, "link": vf.link, "checksum": vf.checksum}
+            for _, vf in keyed_vjsons
+        ],
+        wheel_variant_files=[
+            {
+                "name": whl.name,
+                "link": whl.link,
+                "checksum": whl.checksum,
+                "vprops": whl.vprops,
+            }
+            for whl in wheel_files
+        ],
     )
 
     project_dir = BUILD_DIR / pkg_config.name
     project_dir.mkdir(exist_ok=True, parents=True)
 
-    with (project_dir / "index.html").open(mode="w") as f:
-        f.write(output)
+    write_index_html(project_dir, output)